@@ -1,6 +1,6 @@
-from calendar import monthrange
 from datetime import tzinfo
 from decimal import Decimal
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from datetime import (
     timedelta,
@@ -11,68 +11,130 @@ from datetime import (
 
 from . import constants
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def align_to(value, edge, mode=constants.ALIGN_DAY):
-    if edge not in (constants.LEFT_EDGE, constants.RIGHT_EDGE):
-        raise ValueError('Invalid edge: {}'.format(str(edge)))
+_DEC_ZERO = Decimal(0)
+_US_PER_HOUR = 3600_000_000
+_DEC_ONE = Decimal('1.0')
+_DEC_3600 = Decimal(3600)
 
-    if mode not in (constants.ALIGN_DAY, constants.ALIGN_WEEK, constants.ALIGN_MONTH, constants.ALIGN_YEAR):
-        raise ValueError('Invalid alignment mode: {}'.format(str(mode)))
+_combine = datetime.combine
+_TIME_MIN = time.min
+_TIME_MAX = time.max
 
-    if isinstance(value, datetime):
-        tzinfo = value.tzinfo
-        value = value.date()
-    else:
-        tzinfo = None
 
-    if mode == constants.ALIGN_DAY:
-        new_date = value
-    elif mode == constants.ALIGN_WEEK:
-        start_date = value
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-        if edge == constants.LEFT_EDGE:
-            new_date = start_date - timedelta(days=start_date.isoweekday() - 1)
-        else:
-            new_date = start_date + timedelta(days=7 - start_date.isoweekday())
-    elif mode == constants.ALIGN_MONTH:
-        if edge == constants.LEFT_EDGE:
-            new_date = value.replace(day=1)
-        else:
-            new_date = value.replace(day=monthrange(value.year, value.month)[1])
+
+def _days_in_month(year, month):
+    # A table lookup plus a leap check beats calendar.monthrange, which
+    # also computes the weekday of the first that nothing here needs.
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+
+    return _MDAYS[month - 1]
+
+
+def _align_day(value, edge):
+    return value
+
+
+def _align_week_left(value, edge):
+    # Ordinal 1 is a Monday, so (ordinal - 1) % 7 is isoweekday - 1.
+    ordinal = value.toordinal()
+
+    return date.fromordinal(ordinal - (ordinal - 1) % 7)
+
+
+def _align_week_right(value, edge):
+    ordinal = value.toordinal()
+
+    return date.fromordinal(ordinal - (ordinal - 1) % 7 + 6)
+
+
+def _align_month(value, edge):
+    if edge == constants.LEFT_EDGE:
+        return date(value.year, value.month, 1)
     else:
-        if edge == constants.LEFT_EDGE:
-            new_date = value.replace(month=1, day=1)
-        else:
-            new_date = value.replace(month=12, day=31)
+        return date(value.year, value.month, _days_in_month(value.year, value.month))
 
+
+def _align_year(value, edge):
     if edge == constants.LEFT_EDGE:
-        result = datetime.combine(
-            new_date,
-            time.min,
-        )
+        return date(value.year, 1, 1)
     else:
-        result = datetime.combine(
-            new_date,
-            time.max,
-        )
+        return date(value.year, 12, 31)
+
+
+_ALIGN_HANDLERS = {
+    (constants.ALIGN_DAY, constants.LEFT_EDGE): _align_day,
+    (constants.ALIGN_DAY, constants.RIGHT_EDGE): _align_day,
+    (constants.ALIGN_WEEK, constants.LEFT_EDGE): _align_week_left,
+    (constants.ALIGN_WEEK, constants.RIGHT_EDGE): _align_week_right,
+    (constants.ALIGN_MONTH, constants.LEFT_EDGE): _align_month,
+    (constants.ALIGN_MONTH, constants.RIGHT_EDGE): _align_month,
+    (constants.ALIGN_YEAR, constants.LEFT_EDGE): _align_year,
+    (constants.ALIGN_YEAR, constants.RIGHT_EDGE): _align_year,
+}
+
+
+@lru_cache(maxsize=2048)
+def _align_to_cached(value, value_tzinfo, edge, mode):
+    # value_tzinfo is part of the cache key because datetimes at the same
+    # instant in different timezones compare (and hash) equal but align to
+    # different results.
+    handler = _ALIGN_HANDLERS[(mode, edge)]
+
+    if isinstance(value, datetime):
+        value = value.date()
+
+    result = _combine(
+        handler(value, edge),
+        _TIME_MIN if edge == constants.LEFT_EDGE else _TIME_MAX,
+    )
 
-    return result if tzinfo is None else localize(result, tzinfo)
+    return result if value_tzinfo is None else localize(result, value_tzinfo)
+
+
+def align_to(value, edge, mode=constants.ALIGN_DAY):
+    if (mode, edge) not in _ALIGN_HANDLERS:
+        if edge not in (constants.LEFT_EDGE, constants.RIGHT_EDGE):
+            raise ValueError('Invalid edge: {}'.format(str(edge)))
+
+        raise ValueError('Invalid alignment mode: {}'.format(str(mode)))
+
+    return _align_to_cached(value, getattr(value, 'tzinfo', None), edge, mode)
 
 
 def align_to_day(value, edge=constants.LEFT_EDGE):
-    return align_to(value, edge=edge, mode=constants.ALIGN_DAY)
+    try:
+        return _align_to_cached(value, getattr(value, 'tzinfo', None), edge, constants.ALIGN_DAY)
+    except KeyError:
+        raise ValueError('Invalid edge: {}'.format(str(edge)))
 
 
 def align_to_week(value, edge=constants.LEFT_EDGE):
-    return align_to(value, edge=edge, mode=constants.ALIGN_WEEK)
+    try:
+        return _align_to_cached(value, getattr(value, 'tzinfo', None), edge, constants.ALIGN_WEEK)
+    except KeyError:
+        raise ValueError('Invalid edge: {}'.format(str(edge)))
 
 
 def align_to_month(value, edge=constants.LEFT_EDGE):
-    return align_to(value, edge=edge, mode=constants.ALIGN_MONTH)
+    try:
+        return _align_to_cached(value, getattr(value, 'tzinfo', None), edge, constants.ALIGN_MONTH)
+    except KeyError:
+        raise ValueError('Invalid edge: {}'.format(str(edge)))
 
 
 def align_to_year(value, edge=constants.LEFT_EDGE):
-    return align_to(value, edge=edge, mode=constants.ALIGN_YEAR)
+    try:
+        return _align_to_cached(value, getattr(value, 'tzinfo', None), edge, constants.ALIGN_YEAR)
+    except KeyError:
+        raise ValueError('Invalid edge: {}'.format(str(edge)))
 
 
 def next_nth_of_month(nth, from_date):
@@ -89,7 +151,7 @@ def next_nth_of_month(nth, from_date):
         return date(from_date.year, from_date.month, nth)
     else:
         next_month = from_date + relativedelta(months=1)
-        return next_month.replace(day=min(nth, monthrange(next_month.year, next_month.month)[1]))
+        return next_month.replace(day=min(nth, _days_in_month(next_month.year, next_month.month)))
 
 
 def date_edges(start_date, end_date=None):
@@ -101,9 +163,9 @@ def date_edges(start_date, end_date=None):
 
 def duration_to_unit_hours(duration, decimal_places=None):
     if duration is None:
-        return Decimal(0)
+        return _DEC_ZERO
 
-    result = Decimal(duration.total_seconds()) / Decimal(3600)
+    result = Decimal(duration.total_seconds()) / _DEC_3600
 
     if decimal_places is None:
         return result
@@ -113,7 +175,7 @@ def duration_to_unit_hours(duration, decimal_places=None):
 
 def duration_to_rounded_unit_hours(duration, decimal_places=None, rounding_step=None, rounding_mode=None):
     if duration is None:
-        return Decimal('0.0')
+        return _DEC_ZERO
 
     unit_hours = duration_to_unit_hours(duration, decimal_places=decimal_places)
 
@@ -122,27 +184,81 @@ def duration_to_rounded_unit_hours(duration, decimal_places=None, rounding_step=
     elif rounding_mode == constants.ROUNDING_MODE_FLOOR:
         remainder = unit_hours % rounding_step
 
-        if remainder == Decimal(0):
+        if remainder == _DEC_ZERO:
             return unit_hours
         else:
             return unit_hours - remainder
     elif rounding_mode == constants.ROUNDING_MODE_CEILING:
         remainder = unit_hours % rounding_step
 
-        if remainder == Decimal(0):
+        if remainder == _DEC_ZERO:
             return unit_hours
         else:
             return unit_hours + (rounding_step - remainder)
     elif rounding_mode == constants.ROUNDING_MODE_STANDARD:
-        fraction = Decimal('1.0') / rounding_step
+        fraction = _DEC_ONE / rounding_step
 
         return round(unit_hours * fraction) / fraction
 
     raise ValueError('Invalid rounding mode: {}'.format(rounding_mode))
 
 
+def duration_to_unit_hours_array(durations, decimal_places=None, rounding_step=None, rounding_mode=None):
+    """
+    Vectorized counterpart of duration_to_unit_hours / duration_to_rounded_unit_hours.
+    Operates on a numpy array of timedelta64 values and returns float64 unit hours,
+    trading the Decimal precision of the scalar API for bulk throughput.
+    Requires numpy.
+    :param durations:
+    :type durations: numpy.ndarray of timedelta64
+    :param decimal_places:
+    :type decimal_places: int
+    :param rounding_step:
+    :type rounding_step: float
+    :param rounding_mode:
+    :type rounding_mode: str
+    """
+
+    if np is None:
+        raise ImportError('numpy is required for duration_to_unit_hours_array')
+
+    unit_hours = durations.astype('timedelta64[us]').view('i8') / _US_PER_HOUR
+
+    if decimal_places is not None:
+        unit_hours = np.round(unit_hours, decimal_places)
+
+    if rounding_step is None or rounding_mode is None:
+        return unit_hours
+
+    rounding_step = float(rounding_step)
+
+    if rounding_mode == constants.ROUNDING_MODE_FLOOR:
+        return np.floor(unit_hours / rounding_step) * rounding_step
+    elif rounding_mode == constants.ROUNDING_MODE_CEILING:
+        return np.ceil(unit_hours / rounding_step) * rounding_step
+    elif rounding_mode == constants.ROUNDING_MODE_STANDARD:
+        return np.round(unit_hours / rounding_step) * rounding_step
+
+    raise ValueError('Invalid rounding mode: {}'.format(rounding_mode))
+
+
 def localize(value, tz):
+    """
+    Attach a timezone to a naive datetime or convert an aware one.
+    Naive values take the cheap replace(tzinfo=...) path, which is all
+    stdlib timezone/zoneinfo objects need; tzinfo objects exposing a
+    pytz-style localize method are delegated to instead, since for those
+    replace() would skip DST normalization.
+    :param value:
+    :type value: datetime
+    :param tz:
+    :type tz: tzinfo
+    """
+
     if value.tzinfo is None:
+        if hasattr(tz, 'localize'):
+            return tz.localize(value)
+
         return value.replace(tzinfo=tz)
     else:
         return value.astimezone(tz)
@@ -1,6 +1,6 @@
 from datetime import timezone
 
-from copy import deepcopy
+from bisect import bisect_right
 from datetime import (
     datetime,
     timedelta,
@@ -18,15 +18,126 @@ from .shortcuts import (
     duration_to_unit_hours,
     duration_to_rounded_unit_hours,
 )
-from .shortcuts import localize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_UTC = timezone.utc
+
+_ONE_US = timedelta(microseconds=1)
+
+_TZ_CACHE = {}
+_TZ_INTERNED = {}
+
+
+def _intern_tz(tz):
+    """
+    Return a canonical instance for equivalent tzinfo objects, so slices
+    built from different but equivalent tzinfos share identity and hit the
+    is-based fast paths in comparisons and _as_utc.
+    """
+
+    if tz is _UTC:
+        return tz
+
+    # Repeat constructions usually pass the same tzinfo object, so a
+    # direct lookup on it skips building the descriptive key below.
+    try:
+        return _TZ_INTERNED[tz]
+    except (KeyError, TypeError):
+        pass
+
+    if isinstance(tz, timezone):
+        key = (timezone, tz.utcoffset(None))
+    else:
+        key = (type(tz), str(tz))
+
+    canonical = _TZ_CACHE.setdefault(key, tz)
+
+    try:
+        _TZ_INTERNED[tz] = canonical
+    except TypeError:
+        pass
+
+    return canonical
+
+
+def _as_utc(value):
+    """
+    Normalize a datetime to UTC, skipping the astimezone call when the
+    value is already UTC; naive values are taken to be UTC.
+    """
+
+    tzinfo = value.tzinfo
+
+    if tzinfo is _UTC:
+        return value
+    elif tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    else:
+        return value.astimezone(_UTC)
+
+
+class _RoundingConfig(object):
+    """
+    Shared bundle for the unit-hour rounding fields. Instances are
+    interned and treated as immutable, so derived slices copy a single
+    reference instead of three attributes; the TimeSlice property
+    setters swap the whole bundle rather than mutating it.
+    """
+
+    __slots__ = ('decimal_places', 'rounding_step', 'rounding_mode')
+
+    def __init__(self, decimal_places=2, rounding_step=None, rounding_mode=None):
+        self.decimal_places = decimal_places
+        self.rounding_step = rounding_step
+        self.rounding_mode = rounding_mode
+
+
+_DEFAULT_ROUNDING = _RoundingConfig()
+_ROUNDING_CACHE = {(2, None, None): _DEFAULT_ROUNDING}
+
+
+def _intern_rounding(decimal_places, rounding_step, rounding_mode):
+    key = (decimal_places, rounding_step, rounding_mode)
+
+    try:
+        config = _ROUNDING_CACHE.get(key)
+    except TypeError:
+        # Unhashable rounding_step; hand back an uncached bundle.
+        return _RoundingConfig(decimal_places, rounding_step, rounding_mode)
+
+    if config is None:
+        config = _ROUNDING_CACHE[key] = _RoundingConfig(decimal_places, rounding_step, rounding_mode)
+
+    return config
+
+
+_SAKAMOTO_T = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+
+def _iso_weekday_of_first(year, month):
+    """
+    ISO weekday of the first day of a month via Sakamoto's algorithm;
+    avoids allocating a date object just to read its weekday.
+    """
+
+    if month < 3:
+        year -= 1
+
+    weekday = (year + year // 4 - year // 100 + year // 400 + _SAKAMOTO_T[month - 1] + 1) % 7
+
+    return weekday or 7
 
 
 class TimeSlice(object):
     LEFT_EDGE = constants.LEFT_EDGE
     RIGHT_EDGE = constants.RIGHT_EDGE
 
-    _start = None
-    _end = None
+    __slots__ = ('_start', '_end', '_start_local', '_end_local', '_duration',
+                 '_unit_hours', '_rounded_unit_hours', '_rounding', 'tz')
 
     def __init__(self, start, end=None, duration=None, tz=None,
                  decimal_places=2, rounding_step=None, rounding_mode=None):
@@ -48,14 +159,23 @@ class TimeSlice(object):
         """
 
         if tz is None:
-            if start.tzinfo is None:
-                self.tz = timezone.utc
+            tzinfo = start.tzinfo
+
+            # Naive and already-UTC starts are the common case and need
+            # no interning at all.
+            if tzinfo is None or tzinfo is _UTC:
+                self.tz = _UTC
             else:
-                self.tz = start.tzinfo
+                self.tz = _intern_tz(tzinfo)
         else:
-            self.tz = tz
+            self.tz = _intern_tz(tz)
 
-        self._start = start.astimezone(timezone.utc)
+        self._start = _as_utc(start)
+        self._start_local = None
+        self._end_local = None
+        self._duration = None
+        self._unit_hours = None
+        self._rounded_unit_hours = None
 
         if end is not None and duration is None:
             self.end = end
@@ -69,36 +189,45 @@ class TimeSlice(object):
         if self.start > self.end:
             raise ValueError('Start cannot come after the end of a TimeSlice')
 
-        self.decimal_places = decimal_places
-        self.rounding_step = rounding_step
-        self.rounding_mode = rounding_mode
+        self._rounding = _intern_rounding(decimal_places, rounding_step, rounding_mode)
 
     def __add__(self, other):
-        start_time = self.start + other
-        end_time = self.end + other
-
-        return TimeSlice(
-            start_time,
-            end=end_time,
-            decimal_places=self.decimal_places,
-            rounding_step=self.rounding_step,
-            rounding_mode=self.rounding_mode,
+        # other is a timedelta, so arithmetic on the UTC endpoints stays
+        # UTC; the remaining fields are copied by reference.
+        return TimeSlice._from_utc(
+            self._start + other,
+            self._end + other,
+            self.tz,
+            self._rounding,
         )
 
     def __sub__(self, other):
-        start_time = self.start - other
-        end_time = self.end - other
-
-        return TimeSlice(
-            start_time,
-            end=end_time,
-            decimal_places=self.decimal_places,
-            rounding_step=self.rounding_step,
-            rounding_mode=self.rounding_mode,
+        return TimeSlice._from_utc(
+            self._start - other,
+            self._end - other,
+            self.tz,
+            self._rounding,
         )
 
     def __eq__(self, other):
-        return self._start == other._start and self._end == other._end
+        if other is self:
+            return True
+
+        if not isinstance(other, TimeSlice):
+            return NotImplemented
+
+        # Ends are compared first: aligned slices frequently share a start,
+        # so the end is the more discriminating field.
+        return self._end == other._end and self._start == other._start
+
+    def __lt__(self, other):
+        return (self._start, self._end) < (other._start, other._end)
+
+    def __hash__(self):
+        # Equality (and therefore hashing) deliberately ignores tz and the
+        # rounding configuration; two slices covering the same instants are
+        # the same slice.
+        return hash((self._start, self._end))
 
     def __str__(self):
         return 'Time Slice: {} - {}'.format(
@@ -109,6 +238,48 @@ class TimeSlice(object):
     def __repr__(self):
         return '<{}>'.format(str(self))
 
+    @classmethod
+    def _from_validated(cls, start, end):
+        """
+        Internal constructor for callers that guarantee start <= end and
+        timezone-aware datetimes; skips the __init__ validation.
+        """
+
+        time_slice = cls.__new__(cls)
+
+        time_slice.tz = start.tzinfo
+        time_slice._start = _as_utc(start)
+        time_slice._end = _as_utc(end)
+        time_slice._start_local = start
+        time_slice._end_local = end
+        time_slice._duration = None
+        time_slice._unit_hours = None
+        time_slice._rounded_unit_hours = None
+        time_slice._rounding = _DEFAULT_ROUNDING
+
+        return time_slice
+
+    @classmethod
+    def _from_utc(cls, start_utc, end_utc, tz, rounding=_DEFAULT_ROUNDING):
+        """
+        Internal constructor for callers holding known-valid UTC endpoints;
+        skips the normalization and ordering checks of __init__ entirely.
+        """
+
+        time_slice = cls.__new__(cls)
+
+        time_slice.tz = tz
+        time_slice._start = start_utc
+        time_slice._end = end_utc
+        time_slice._start_local = None
+        time_slice._end_local = None
+        time_slice._duration = None
+        time_slice._unit_hours = None
+        time_slice._rounded_unit_hours = None
+        time_slice._rounding = rounding
+
+        return time_slice
+
     @staticmethod
     def from_dates(start_date, end_date=None, tz=None):
         if end_date is None:
@@ -122,11 +293,17 @@ class TimeSlice(object):
 
     @property
     def spans_dst_start(self):
-        return False if self.tz is None else self.start.dst() < self.end.dst()
+        start_dst = self.start.dst()
+        end_dst = self.end.dst()
+
+        return start_dst is not None and end_dst is not None and start_dst < end_dst
 
     @property
     def spans_dst_end(self):
-        return False if self.tz is None else self.start.dst() > self.end.dst()
+        start_dst = self.start.dst()
+        end_dst = self.end.dst()
+
+        return start_dst is not None and end_dst is not None and start_dst > end_dst
 
     @property
     def zero_length(self):
@@ -134,42 +311,99 @@ class TimeSlice(object):
 
     @property
     def duration(self):
-        return self._end - self._start
+        if self._duration is None:
+            self._duration = self._end - self._start
+
+        return self._duration
+
+    @property
+    def decimal_places(self):
+        return self._rounding.decimal_places
+
+    @decimal_places.setter
+    def decimal_places(self, value):
+        rounding = self._rounding
+        self._rounding = _intern_rounding(value, rounding.rounding_step, rounding.rounding_mode)
+        self._unit_hours = None
+        self._rounded_unit_hours = None
+
+    @property
+    def rounding_step(self):
+        return self._rounding.rounding_step
+
+    @rounding_step.setter
+    def rounding_step(self, value):
+        rounding = self._rounding
+        self._rounding = _intern_rounding(rounding.decimal_places, value, rounding.rounding_mode)
+        self._rounded_unit_hours = None
+
+    @property
+    def rounding_mode(self):
+        return self._rounding.rounding_mode
+
+    @rounding_mode.setter
+    def rounding_mode(self, value):
+        rounding = self._rounding
+        self._rounding = _intern_rounding(rounding.decimal_places, rounding.rounding_step, value)
+        self._rounded_unit_hours = None
 
     @property
     def unit_hours(self):
-        return duration_to_unit_hours(
-            self.duration,
-            decimal_places=self.decimal_places,
-        )
+        if self._unit_hours is None:
+            self._unit_hours = duration_to_unit_hours(
+                self.duration,
+                decimal_places=self._rounding.decimal_places,
+            )
+
+        return self._unit_hours
 
     @property
     def rounded_unit_hours(self):
-        return duration_to_rounded_unit_hours(
-            self.duration,
-            decimal_places=self.decimal_places,
-            rounding_step=self.rounding_step,
-            rounding_mode=self.rounding_mode,
-        )
+        if self._rounded_unit_hours is None:
+            rounding = self._rounding
+
+            self._rounded_unit_hours = duration_to_rounded_unit_hours(
+                self.duration,
+                decimal_places=rounding.decimal_places,
+                rounding_step=rounding.rounding_step,
+                rounding_mode=rounding.rounding_mode,
+            )
+
+        return self._rounded_unit_hours
 
     @property
     def start(self):
-        return self._start.astimezone(self.tz)
+        if self._start_local is None:
+            # UTC slices can hand back the stored endpoint as-is.
+            self._start_local = self._start if self.tz is _UTC else self._start.astimezone(self.tz)
+
+        return self._start_local
 
     @start.setter
     def start(self, value):
-        self._start = value.astimezone(timezone.utc)
+        self._start = _as_utc(value)
+        self._start_local = None
+        self._duration = None
+        self._unit_hours = None
+        self._rounded_unit_hours = None
 
         if self._start > self._end:
             raise ValueError('Start cannot be set to a time after the end of a TimeSlice')
 
     @property
     def end(self):
-        return self._end.astimezone(self.tz)
+        if self._end_local is None:
+            self._end_local = self._end if self.tz is _UTC else self._end.astimezone(self.tz)
+
+        return self._end_local
 
     @end.setter
     def end(self, value):
-        self._end = value.astimezone(timezone.utc)
+        self._end = _as_utc(value)
+        self._end_local = None
+        self._duration = None
+        self._unit_hours = None
+        self._rounded_unit_hours = None
 
         if self._start > self._end:
             raise ValueError('End cannot be set to a time before the start of a TimeSlice')
@@ -183,62 +417,187 @@ class TimeSlice(object):
         return self.start.date(), self.end.date()
 
     def copy(self):
-        return deepcopy(self)
+        # All fields are immutable, so a field-for-field clone is
+        # equivalent to (and much cheaper than) deepcopy.
+        return TimeSlice._from_utc(
+            self._start,
+            self._end,
+            self.tz,
+            self._rounding,
+        )
 
     def occludes(self, other):
-        return self._start <= other._start <= self._end and self._start <= other._end <= self._end
+        start = self._start
+        end = self._end
+
+        return start <= other._start <= end and start <= other._end <= end
 
     def occluded_by(self, other):
-        return other._start <= self._start <= other._end and other._start <= self._end <= other._end
+        start = self._start
+        end = self._end
+
+        return other._start <= start <= other._end and other._start <= end <= other._end
 
     def overlaps(self, other):
-        if type(other) == datetime:
-            try:
-                comparison = localize(other, timezone.utc)
-            except ValueError:
-                comparison = other
+        start = self._start
+        end = self._end
 
-            return self._start <= comparison <= self._end
-        else:
-            return any((
-                other._start <= self._start <= other._end,
-                other._start <= self._end <= other._end,
-                self._start <= other._start <= self._end,
-                self._start <= other._end <= self._end,
-            ))
+        if isinstance(other, datetime):
+            return start <= _as_utc(other) <= end
+
+        # Two short-circuit comparisons settle it: with inclusive
+        # boundaries, the slices overlap iff neither ends before the
+        # other starts.
+        return other._start <= end and start <= other._end
 
     def before(self, other):
-        if type(other) == datetime:
-            return self._end <= localize(self._end, timezone.utc)
-        else:
-            return self._end <= other._start
+        if isinstance(other, datetime):
+            return self._end <= _as_utc(other)
+
+        return self._end <= other._start
 
     def after(self, other):
-        if type(other) == datetime:
-            return self._start >= other
+        if isinstance(other, datetime):
+            return self._start >= _as_utc(other)
+
+        return self._start >= other._end
+
+    def iter_ranges(self, interval):
+        """
+        Yield (start, end) tuples instead of TimeSlice objects; cheaper for
+        callers that only read the boundaries.
+        timedelta intervals are treated as absolute durations and stepped in
+        UTC; relativedelta intervals follow the local calendar, including
+        DST adjustments.
+        """
+
+        if isinstance(interval, timedelta):
+            return self._iter_ranges_timedelta(interval)
+
+        return self._iter_ranges_relativedelta(interval)
+
+    def _iter_ranges_timedelta(self, interval):
+        tz = self.tz
+        step_less_one = interval - _ONE_US
+        current = self._start
+        end = self._end
+
+        upper = current + step_less_one
+
+        while upper <= end:
+            yield current.astimezone(tz), upper.astimezone(tz)
+
+            current += interval
+            upper += interval
+
+    def _iter_ranges_relativedelta(self, interval):
+        current_time_slice = TimeSlice(self.start, end=self.start + interval)
+        outer_end = self.end
+
+        if isinstance(self.tz, timezone):
+            # Fixed-offset zones never observe DST, so the per-iteration
+            # span checks are dead weight; run the bare loop.
+            while current_time_slice.end - _ONE_US <= outer_end:
+                yield current_time_slice.start, current_time_slice.end - _ONE_US
+
+                current_time_slice = TimeSlice._from_validated(
+                    current_time_slice.start + interval,
+                    current_time_slice.end + interval,
+                )
         else:
-            return self._start >= other._end
+            while current_time_slice.end - _ONE_US <= outer_end:
+                yield current_time_slice.start, current_time_slice.end - _ONE_US
+
+                # relativedelta steps follow the local calendar, so the
+                # arithmetic has to run on the localized endpoints.
+                current_time_slice = TimeSlice._from_validated(
+                    current_time_slice.start + interval,
+                    current_time_slice.end + interval,
+                )
+
+                if current_time_slice.spans_dst_start:
+                    current_time_slice.end -= current_time_slice.end.dst()
+                elif current_time_slice.spans_dst_end:
+                    current_time_slice.end += current_time_slice.end.dst()
 
     def iter(self, interval):
-        one_microsecond = timedelta(microseconds=1)
+        if isinstance(interval, timedelta):
+            return self._iter_timedelta(interval)
 
-        current_time_slice = TimeSlice(self.start, end=self.start + interval)
+        return self._iter_relativedelta(interval)
 
-        while current_time_slice.end - one_microsecond <= self.end:
-            yield TimeSlice(current_time_slice.start, end=current_time_slice.end - one_microsecond)
+    def _iter_timedelta(self, interval):
+        # Yield straight off the UTC cursor; localization happens
+        # lazily if and when the caller reads start/end.
+        tz = self.tz
+        step_less_one = interval - _ONE_US
+        current = self._start
+        end = self._end
+        from_utc = TimeSlice._from_utc
 
-            current_time_slice += interval
+        upper = current + step_less_one
 
-            if current_time_slice.spans_dst_start:
-                current_time_slice.end -= current_time_slice.end.dst()
-            elif current_time_slice.spans_dst_end:
-                current_time_slice.end += current_time_slice.end.dst()
+        while upper <= end:
+            yield from_utc(current, upper, tz)
+
+            current += interval
+            upper += interval
+
+    def _iter_relativedelta(self, interval):
+        for start, end in self._iter_ranges_relativedelta(interval):
+            yield TimeSlice._from_validated(start, end)
+
+    def iter_days_array(self, step=1):
+        """
+        Return the day boundaries of the slice as a numpy datetime64[us]
+        array in one C-level call, for callers that consume arrays rather
+        than TimeSlice objects. Values are UTC with the tzinfo dropped,
+        since datetime64 is timezone-naive. Requires numpy.
+        """
+
+        if np is None:
+            raise ImportError('numpy is required for iter_days_array')
+
+        return np.arange(
+            np.datetime64(self._start.replace(tzinfo=None), 'us'),
+            np.datetime64(self._end.replace(tzinfo=None), 'us'),
+            np.timedelta64(step, 'D'),
+        )
+
+    def to_arrays_days(self, step=1):
+        """
+        Return (starts, ends) of the slice's day periods as numpy
+        datetime64[us] arrays built in two C-level calls, for callers that
+        consume arrays rather than TimeSlice objects. Ends follow the
+        usual inclusive convention of a microsecond before the next start,
+        with the final end clamped to the slice's own end, so a trailing
+        partial day is included. Values are UTC with the tzinfo dropped,
+        since datetime64 is timezone-naive. Requires numpy.
+        """
+
+        if np is None:
+            raise ImportError('numpy is required for to_arrays_days')
+
+        step_us = np.timedelta64(step * 86400_000_000, 'us')
+        end = np.datetime64(self._end.replace(tzinfo=None), 'us')
+
+        starts = np.arange(
+            np.datetime64(self._start.replace(tzinfo=None), 'us'),
+            end,
+            step_us,
+        )
+        ends = np.minimum(starts + (step_us - np.timedelta64(1, 'us')), end)
+
+        return starts, ends
 
     def iter_days(self, step=1):
-        return self.iter(relativedelta(days=step))
+        # Day and week steps are fixed durations, so they go straight to
+        # the timedelta generator; only month/year steps need calendar
+        # arithmetic.
+        return self._iter_timedelta(timedelta(days=step))
 
     def iter_weeks(self, step=1):
-        return self.iter(relativedelta(days=7 * step))
+        return self._iter_timedelta(timedelta(weeks=step))
 
     def iter_months(self, step=1):
         return self.iter(relativedelta(months=step))
@@ -289,10 +648,14 @@ class TimeSlice(object):
     def shift_left(self, duration):
         self._start = self._start - duration
         self._end = self._end - duration
+        self._start_local = None
+        self._end_local = None
 
     def shift_right(self, duration):
         self._end = self._end + duration
         self._start = self._start + duration
+        self._start_local = None
+        self._end_local = None
 
     def split(self, split_time):
         if not self.overlaps(split_time):
@@ -341,7 +704,10 @@ class TimeSlice(object):
 
     def merge(self, other):
         if self.overlaps(other):
-            return TimeSlice(start=min(self.start, other.start), end=max(self.end, other.end))
+            return TimeSlice._from_validated(
+                self.start if self._start <= other._start else other.start,
+                self.end if self._end >= other._end else other.end,
+            )
 
         raise ValueError('Cannot merge; Time slices do not overlap')
 
@@ -359,8 +725,83 @@ class TimeSlice(object):
         ).text
 
 
+class TimeSliceArray(object):
+    """
+    Struct-of-arrays companion to TimeSlice for bulk analytics: boundaries
+    are held as parallel numpy datetime64[us] arrays (UTC, tz-naive) so
+    comparisons and arithmetic run as single C calls instead of one Python
+    object per slice. Requires numpy.
+    """
+
+    __slots__ = ('starts', 'ends', 'tz')
+
+    def __init__(self, starts, ends, tz=None):
+        if np is None:
+            raise ImportError('numpy is required for TimeSliceArray')
+
+        self.starts = np.asarray(starts, dtype='datetime64[us]')
+        self.ends = np.asarray(ends, dtype='datetime64[us]')
+        self.tz = _UTC if tz is None else tz
+
+        if self.starts.shape != self.ends.shape:
+            raise ValueError('Starts and ends must have the same shape')
+
+    def __len__(self):
+        return len(self.starts)
+
+    @classmethod
+    def from_slices(cls, time_slices, tz=None):
+        time_slices = list(time_slices)
+
+        if tz is None and len(time_slices) > 0:
+            tz = time_slices[0].tz
+
+        return cls(
+            [time_slice._start.replace(tzinfo=None) for time_slice in time_slices],
+            [time_slice._end.replace(tzinfo=None) for time_slice in time_slices],
+            tz=tz,
+        )
+
+    def to_slices(self):
+        tz = self.tz
+
+        return [
+            TimeSlice(start.item().replace(tzinfo=_UTC), end=end.item().replace(tzinfo=_UTC), tz=tz)
+            for start, end in zip(self.starts, self.ends)
+        ]
+
+    @property
+    def durations(self):
+        return self.ends - self.starts
+
+    @property
+    def cumulative_duration(self):
+        return self.durations.sum().item()
+
+    def shift(self, duration):
+        return TimeSliceArray(
+            self.starts + np.timedelta64(duration),
+            self.ends + np.timedelta64(duration),
+            tz=self.tz,
+        )
+
+    def overlaps(self, other):
+        """
+        Return a boolean array marking the slices that overlap the given
+        TimeSlice. Comparisons run on int64 views, which are cheaper than
+        datetime64 comparisons.
+        """
+
+        start = np.datetime64(other._start.replace(tzinfo=None), 'us').view('i8')
+        end = np.datetime64(other._end.replace(tzinfo=None), 'us').view('i8')
+
+        return (self.starts.view('i8') <= end) & (self.ends.view('i8') >= start)
+
+
 class NthWeekdayCalculator(object):
 
+    __slots__ = ('year', 'month', 'nth', 'iso_weekday', 'day', '_date')
+
     def __init__(self, year, month, nth, iso_weekday):
         """
         Finds the nth instance of a certain weekday in a specific month, e.g. 3rd Wednesday of the month
@@ -376,14 +817,44 @@ class NthWeekdayCalculator(object):
         self.nth = nth
         self.iso_weekday = iso_weekday
 
-        weekday_offset = iso_weekday - date(year=self.year, month=self.month, day=1).isoweekday()
+        # The modulo folds the negative-offset correction into the same
+        # expression sequence() already uses.
+        weekday_offset = (iso_weekday - _iso_weekday_of_first(year, month)) % 7
+
+        self.day = (7 * (nth - 1)) + 1 + weekday_offset
+
+        self._date = None
+
+    @staticmethod
+    def sequence(from_year, from_month, count, nth, iso_weekday):
+        """
+        Return the dates of the nth iso_weekday for count consecutive months
+        starting at (from_year, from_month). Uses integer weekday arithmetic
+        throughout instead of chaining calculators via next, so only the
+        resulting date objects are allocated.
+        """
+
+        results = []
+        append = results.append
+
+        year = from_year
+        month = from_month
 
         sequence_baseline = (7 * (nth - 1)) + 1
+        iso_weekday_of_first = _iso_weekday_of_first
 
-        if weekday_offset >= 0:
-            self.day = sequence_baseline + weekday_offset
-        else:
-            self.day = sequence_baseline + weekday_offset + 7
+        for _ in range(count):
+            weekday_offset = (iso_weekday - iso_weekday_of_first(year, month)) % 7
+
+            append(date(year=year, month=month, day=sequence_baseline + weekday_offset))
+
+            if month == 12:
+                year += 1
+                month = 1
+            else:
+                month += 1
+
+        return results
 
     @staticmethod
     def new_by_date(from_date, nth, iso_weekday):
@@ -396,7 +867,10 @@ class NthWeekdayCalculator(object):
 
     @property
     def date(self):
-        return date(year=self.year, month=self.month, day=self.day)
+        if self._date is None:
+            self._date = date(year=self.year, month=self.month, day=self.day)
+
+        return self._date
 
     @property
     def previous(self):
@@ -435,18 +909,21 @@ class NthWeekdayCalculator(object):
 
 class FormattedDuration(object):
 
-    hours = None
-    days = None
-    minutes = None
+    __slots__ = ('duration', 'days', 'hours', 'minutes', '_text',
+                 '_day_label', '_hour_label', '_minute_label',
+                 '_day_label_plural', '_hour_label_plural', '_minute_label_plural')
 
     def __init__(self, duration, day_label='day', hour_label='hr', minute_label='min',
                  day_label_plural=None, hour_label_plural=None, minute_label_plural=None):
 
         self.duration = duration
 
-        self.hours = int(self.duration.total_seconds() // 3600)
-        self.days = int(self.hours / 24)
-        self.minutes = int((self.duration.total_seconds() % 3600) // 60)
+        # Integer fields sidestep the float round-trip of total_seconds();
+        # sub-minute remainders are dropped either way.
+        total_minutes = (duration.days * 86400 + duration.seconds) // 60
+
+        self.days, remainder = divmod(total_minutes, 1440)
+        self.hours, self.minutes = divmod(remainder, 60)
 
         self._day_label = day_label
         self._hour_label = hour_label
@@ -467,35 +944,25 @@ class FormattedDuration(object):
         else:
             self._minute_label_plural = minute_label_plural
 
-        if self.days > 0:
-            self.hours = self.hours % (self.days * 24)
+        # Indexing a (plural, singular) pair by the equality test picks
+        # the label without a branch per component.
+        day_label = (self._day_label_plural, self._day_label)[self.days == 1]
+        hour_label = (self._hour_label_plural, self._hour_label)[self.hours == 1]
+        minute_label = (self._minute_label_plural, self._minute_label)[self.minutes == 1]
+
+        if self.days + self.hours == 0:
+            self._text = f'{self.minutes} {minute_label}'
+        elif self.days == 0:
+            self._text = f'{self.hours} {hour_label} {self.minutes} {minute_label}'
+        else:
+            self._text = f'{self.days} {day_label} {self.hours} {hour_label} {self.minutes} {minute_label}'
 
     def __str__(self):
         return self.text
 
     @property
     def text(self):
-        if self.days + self.hours == 0:
-            return '{} {}'.format(
-                self.minutes,
-                self._minute_label if self.minutes == 1 else self._minute_label_plural,
-            )
-        elif self.days == 0:
-            return '{} {} {} {}'.format(
-                self.hours,
-                self._hour_label if self.hours == 1 else self._hour_label_plural,
-                self.minutes,
-                self._minute_label if self.minutes == 1 else self._minute_label_plural,
-            )
-        else:
-            return '{} {} {} {} {} {}'.format(
-                self.days,
-                self._day_label if self.days == 1 else self._day_label_plural,
-                self.hours,
-                self._hour_label if self.hours == 1 else self._hour_label_plural,
-                self.minutes,
-                self._minute_label if self.minutes == 1 else self._minute_label_plural,
-            )
+        return self._text
 
     @property
     def total_hours(self):
@@ -508,14 +975,25 @@ class FormattedDuration(object):
 
 class TimeLine(object):
 
-    def __init__(self, time_slices=None, reverse=False):
+    def __init__(self, time_slices=None, reverse=False, presorted=False):
+        """
+        An ordered collection of TimeSlices. Mutating time_slices directly
+        is supported but should be followed by a sort() so internal
+        indexes are rebuilt.
+        :param presorted: Skip the initial sort; the caller asserts the
+            slices already arrive in the timeline's order.
+        :type presorted: bool
+        """
+
         self.time_slices = [] if time_slices is None \
             else [time_slices] if isinstance(time_slices, TimeSlice) else \
             list(time_slices)
 
         self._reverse = reverse
+        self._overlap_index = None
 
-        self.sort()
+        if not presorted:
+            self.sort()
 
     def __add__(self, other):
         new_time_line = self.copy()
@@ -539,15 +1017,16 @@ class TimeLine(object):
 
     @property
     def start(self):
+        # Compare on the raw UTC endpoints and localize only the winner.
         try:
-            return min((_.start for _ in self.time_slices))
+            return min(self.time_slices, key=lambda time_slice: time_slice._start).start
         except ValueError:
             return None
 
     @property
     def end(self):
         try:
-            return max((_.end for _ in self.time_slices))
+            return max(self.time_slices, key=lambda time_slice: time_slice._end).end
         except ValueError:
             return None
 
@@ -578,66 +1057,192 @@ class TimeLine(object):
 
         return duration
 
+    def to_array(self, tz=None):
+        """
+        Return the timeline's slices as a TimeSliceArray, so bulk analytics
+        (durations, overlap masks, shifting) run vectorized instead of
+        looping over TimeSlice objects. Requires numpy.
+        """
+
+        return TimeSliceArray.from_slices(self.time_slices, tz=tz)
+
+    @classmethod
+    def from_array(cls, time_slice_array, reverse=False, presorted=False):
+        return cls(time_slice_array.to_slices(), reverse=reverse, presorted=presorted)
+
+    @classmethod
+    def from_arrays(cls, starts, ends, tz=None, reverse=False, presorted=False):
+        """
+        Build a TimeLine from parallel arrays of start and end boundaries
+        (anything TimeSliceArray accepts as datetime64[us]). Requires numpy.
+        """
+
+        return cls.from_array(TimeSliceArray(starts, ends, tz=tz), reverse=reverse, presorted=presorted)
+
     def copy(self):
-        return deepcopy(self)
+        time_line = TimeLine.__new__(TimeLine)
+
+        time_line.time_slices = [time_slice.copy() for time_slice in self.time_slices]
+        time_line._reverse = self._reverse
+        time_line._overlap_index = None
+
+        return time_line
 
     def append(self, time_slice):
         self.time_slices.append(time_slice)
 
+        self._overlap_index = None
+
     def sort(self, reverse=None):
         if reverse is not None:
             self._reverse = reverse
 
-        self.time_slices.sort(key=lambda x: x.range, reverse=self._reverse)
+        self.time_slices.sort(key=lambda x: (x._start, x._end), reverse=self._reverse)
+
+        self._overlap_index = None
 
     def merge_overlap(self):
         if len(self.time_slices) > 0:
-            reverse = self.reverse
-
-            self.sort(reverse=True)
-
-            merged_time_slices = []
-
-            current_slice = self.time_slices.pop()
+            self.time_slices.sort(key=lambda x: (x._start, x._end))
 
-            while len(self.time_slices) > 0:
-                next_time_slice = self.time_slices.pop()
+            merged_time_slices = [self.time_slices[0]]
+            current_slice = merged_time_slices[0]
 
-                try:
-                    current_slice = current_slice.merge(next_time_slice)
-                except ValueError:
-                    merged_time_slices.append(current_slice)
-
-                    current_slice = next_time_slice
+            # Single forward pass over the sorted slices, extending the
+            # accumulator in place instead of constructing merged copies.
+            for time_slice in self.time_slices:
+                if time_slice._start <= current_slice._end:
+                    if time_slice._end > current_slice._end:
+                        current_slice._end = time_slice._end
+                        current_slice._end_local = None
+                        current_slice._duration = None
+                        current_slice._unit_hours = None
+                        current_slice._rounded_unit_hours = None
+                else:
+                    merged_time_slices.append(time_slice)
 
-            merged_time_slices.append(current_slice)
+                    current_slice = time_slice
 
             self.time_slices = merged_time_slices
 
-            self.sort(reverse=reverse)
+            self.sort()
 
     def flatten(self, reverse=None):
         self.sort(reverse=reverse)
         self.merge_overlap()
 
+    def _build_overlap_index(self):
+        # Slices sorted by start plus a running maximum of ends; overlap
+        # queries bisect on the starts and scan back only while the prefix
+        # maximum can still reach the query.
+        indexed = sorted(self.time_slices, key=lambda x: x._start)
+
+        starts = []
+        max_ends = []
+        running_end = None
+
+        for time_slice in indexed:
+            if running_end is None or time_slice._end > running_end:
+                running_end = time_slice._end
+
+            starts.append(time_slice._start)
+            max_ends.append(running_end)
+
+        self._overlap_index = (indexed, starts, max_ends)
+
     def overlaps(self, other):
-        for time_slice in self.time_slices:
-            if time_slice.overlaps(other):
+        if self._overlap_index is None:
+            self._build_overlap_index()
+
+        indexed, starts, max_ends = self._overlap_index
+
+        if isinstance(other, datetime):
+            query_start = query_end = _as_utc(other)
+        else:
+            query_start = other._start
+            query_end = other._end
+
+        index = bisect_right(starts, query_end)
+
+        while index > 0 and max_ends[index - 1] >= query_start:
+            if indexed[index - 1].overlaps(other):
                 return True
 
+            index -= 1
+
         return False
 
     def punch_hole(self, hole):
+        self.punch_holes((hole,))
+
+    def punch_holes(self, holes):
+        """
+        Subtract the holes from every slice in a single sweep over both
+        lists sorted by start, instead of one full pass (and sort) per
+        hole. Boundary conventions match TimeSlice.punch_hole: the slice
+        left of a hole ends a microsecond before it, and the slice to the
+        right starts exactly at the hole's end.
+        """
+
+        if isinstance(holes, TimeLine):
+            holes = holes.time_slices
+
+        holes = sorted(holes, key=lambda x: (x._start, x._end))
+
+        if len(holes) == 0:
+            return
+
         reverse = self.reverse
 
         self.sort(reverse=False)
 
         punched_time_slices = []
 
+        hole_count = len(holes)
+        first_hole = 0
+
         for time_slice in self.time_slices:
-            if hole.overlaps(time_slice):
-                for punched_time_slice in time_slice.punch_hole(hole):
-                    punched_time_slices.append(punched_time_slice)
+            # Holes ending before this slice starts cannot touch it or any
+            # later slice, since slices are sorted by start.
+            while first_hole < hole_count and holes[first_hole]._end < time_slice._start:
+                first_hole += 1
+
+            current_start = time_slice._start
+            end = time_slice._end
+            tz = time_slice.tz
+
+            touched = False
+            consumed = False
+
+            index = first_hole
+
+            while index < hole_count and holes[index]._start <= end:
+                hole = holes[index]
+
+                if hole._end >= current_start:
+                    touched = True
+
+                    if hole._start <= current_start and hole._end >= end:
+                        consumed = True
+
+                        break
+
+                    if hole._start > current_start:
+                        left_end = hole._start - _ONE_US
+
+                        if left_end >= current_start:
+                            punched_time_slices.append(TimeSlice._from_utc(current_start, left_end, tz))
+
+                    if hole._end > current_start:
+                        current_start = hole._end
+
+                index += 1
+
+            if consumed:
+                continue
+            elif touched:
+                if current_start <= end:
+                    punched_time_slices.append(TimeSlice._from_utc(current_start, end, tz))
             else:
                 punched_time_slices.append(time_slice)
 
@@ -645,13 +1250,6 @@ class TimeLine(object):
 
         self.sort(reverse=reverse)
 
-    def punch_holes(self, holes):
-        if isinstance(holes, TimeLine):
-            holes = holes.time_slices
-
-        for hole in holes:
-            self.punch_hole(hole)
-
     def split(self, split_time):
         if self.outer_time_slice.overlaps(split_time):
             reverse = self.reverse